@@ -12,191 +12,464 @@ Relationships:
   * When a voucher is redeemed, a `Redemption` row is created linking the
     redemption back to the offer and voucher.
   * A `Transaction` captures a purchase.  It can optionally reference a
-    `Redemption` and capture the attribution (campaign/offer/voucher) in a
-    JSON field.
+    `Redemption`; the attributed campaign and offer are stored as indexed
+    columns, with any extra attribution metadata kept in a JSON field.  Its
+    basket is stored as one `TransactionLine` row per SKU.
+
+Loading strategies:
+  * Small many-to-one hops on the redemption path are `joined`.  Their
+    one-to-one reverses (`Voucher.redemption`, `Redemption.transaction`) load
+    lazily, so fetching a voucher costs a single SELECT; queries that need
+    them opt in with a loader option.
+  * Unbounded collections (everything hanging off `Tenant`, plus a user's or
+    offer's full voucher/redemption history) use `raise_on_sql`; load them
+    explicitly with a query or loader option instead.
 """
 
 from __future__ import annotations
 
+import enum
+import secrets
+import time
 import uuid
 from datetime import datetime
 from typing import Any, List, Optional
 
 from sqlalchemy import (
+    CHAR,
+    DDL,
     JSON,
-    Boolean,
-    Column,
+    CheckConstraint,
     DateTime,
     ForeignKey,
-    Integer,
+    ForeignKeyConstraint,
+    Index,
+    SmallInteger,
     String,
-    Text,
     UniqueConstraint,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.dialects.sqlite import BLOB
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 
-Base = declarative_base()
+# Decomposed binary JSONB on PostgreSQL (no re-parse on read, GIN-indexable for
+# containment queries), plain JSON on SQLite.  JSONB is the base type so column
+# attributes get its comparator and `.contains()` compiles to `@>`.
+JSONType = JSONB().with_variant(JSON(), "sqlite")
 
 
-def generate_uuid() -> str:
-    """Generate a UUID string suitable for primary keys."""
-    return str(uuid.uuid4())
+class GUID(TypeDecorator):
+    """Platform-independent UUID type.
+
+    Uses PostgreSQL's native ``UUID`` type and a 16-byte ``BLOB`` everywhere
+    else, so keys are stored in binary rather than as 36-character strings.
+    Values are always exposed to Python as :class:`uuid.UUID`.
+    """
+
+    impl = BLOB(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=True))
+        return dialect.type_descriptor(BLOB(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(bytes=bytes(value))
+
+
+class IntEnumType(TypeDecorator):
+    """Store an :class:`enum.IntEnum` as a ``SMALLINT``.
+
+    Comparisons compile to integer equality; values are returned as members
+    of the enum class.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.IntEnum]):
+        super().__init__()
+        self.enum_class = enum_class
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(self.enum_class(value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value)
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562) suitable for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land at
+    the right-hand edge of the primary-key B-tree instead of a random leaf.
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    value = ((ts_ms & 0xFFFF_FFFF_FFFF) << 80) | secrets.randbits(80)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def uuid7_batch(count: int) -> List[uuid.UUID]:
+    """Pre-generate `count` UUIDv7 keys in ascending order for a bulk insert.
+
+    Sorting keeps keys minted within the same millisecond in index order, so a
+    batch appends to the primary-key B-tree sequentially.
+    """
+    return sorted(uuid7() for _ in range(count))
+
+
+SUPPORTED_CURRENCIES = ("USD", "EUR", "GBP", "CAD", "JPY", "AUD")  # ISO 4217
+
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+VOUCHER_CODE_LENGTH = 10
+
+
+def generate_voucher_code() -> str:
+    """Generate a random 10-character Crockford base32 voucher code (50 bits)."""
+    value = secrets.randbits(5 * VOUCHER_CODE_LENGTH)
+    return "".join(
+        CROCKFORD_BASE32[(value >> shift) & 0x1F]
+        for shift in range(5 * (VOUCHER_CODE_LENGTH - 1), -1, -5)
+    )
+
+
+class CampaignStatus(enum.IntEnum):
+    DRAFT = 0
+    ACTIVE = 1
+    PAUSED = 2
+    ENDED = 3
+
+
+class OfferType(enum.IntEnum):
+    PERSONAL = 0
+    GROUP = 1
+
+
+class VoucherState(enum.IntEnum):
+    ISSUED = 0
+    REDEEMED = 1
+    EXPIRED = 2
+    VOID = 3
+
+
+class RedemptionStatus(enum.IntEnum):
+    APPROVED = 0
+    DENIED = 1
+    SETTLED = 2
+
+
+class Base(DeclarativeBase):
+    type_annotation_map = {uuid.UUID: GUID()}
 
 
 class Tenant(Base):
     __tablename__ = "tenants"
 
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    name: str = Column(String, nullable=False, unique=True)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    users = relationship("User", back_populates="tenant")
-    products = relationship("Product", back_populates="tenant")
-    campaigns = relationship("Campaign", back_populates="tenant")
-    offers = relationship("Offer", back_populates="tenant")
-    vouchers = relationship("Voucher", back_populates="tenant")
-    redemptions = relationship("Redemption", back_populates="tenant")
-    transactions = relationship("Transaction", back_populates="tenant")
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    name: Mapped[str] = mapped_column(unique=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    users: Mapped[List[User]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    products: Mapped[List[Product]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    campaigns: Mapped[List[Campaign]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    offers: Mapped[List[Offer]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    vouchers: Mapped[List[Voucher]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    redemptions: Mapped[List[Redemption]] = relationship(
+        back_populates="tenant", lazy="raise_on_sql"
+    )
+    transactions: Mapped[List[Transaction]] = relationship(
+        back_populates="tenant", lazy="raise_on_sql"
+    )
 
 
 class User(Base):
     __tablename__ = "users"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    email: Optional[str] = Column(String, nullable=True)
-    phone: Optional[str] = Column(String, nullable=True)
-    attributes: Any = Column(JSON, default=dict)
-    consent_push: bool = Column(Boolean, default=False)
-    consent_mktg: bool = Column(Boolean, default=False)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    email: Mapped[Optional[str]]
+    phone: Mapped[Optional[str]]
+    attributes: Mapped[Optional[Any]] = mapped_column(JSONType, default=dict)
+    consent_push: Mapped[Optional[bool]] = mapped_column(default=False)
+    consent_mktg: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    tenant = relationship("Tenant", back_populates="users")
-    vouchers = relationship("Voucher", back_populates="user")
-    redemptions = relationship("Redemption", back_populates="user")
-    transactions = relationship("Transaction", back_populates="user")
+    __table_args__ = (
+        # Case-insensitive per-tenant email lookup; also rejects duplicate sign-ups.
+        # Deliberately not partial: NULL emails never collide in a unique index,
+        # and a predicate would stop SQLite from using it for lower(email) lookups.
+        Index("uix_user_tenant_email_lower", "tenant_id", text("lower(email)"), unique=True),
+        Index("ix_user_tenant_phone", "tenant_id", "phone"),
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="users")
+    vouchers: Mapped[List[Voucher]] = relationship(back_populates="user", lazy="raise_on_sql")
+    redemptions: Mapped[List[Redemption]] = relationship(back_populates="user", lazy="raise_on_sql")
+    transactions: Mapped[List[Transaction]] = relationship(
+        back_populates="user", lazy="raise_on_sql"
+    )
 
 
 class Product(Base):
     __tablename__ = "products"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    sku: str = Column(String, nullable=False)
-    name: str = Column(String, nullable=False)
-    category: Optional[str] = Column(String, nullable=True)
-    price_cents: int = Column(Integer, nullable=False)
-    attributes: Any = Column(JSON, default=dict)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    sku: Mapped[str]
+    name: Mapped[str]
+    category: Mapped[Optional[str]]
+    price_cents: Mapped[int]
+    attributes: Mapped[Optional[Any]] = mapped_column(JSONType, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("tenant_id", "sku", name="uix_tenant_sku"),
     )
 
-    tenant = relationship("Tenant", back_populates="products")
+    tenant: Mapped[Tenant] = relationship(back_populates="products")
 
 
 class Campaign(Base):
     __tablename__ = "campaigns"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    name: str = Column(String, nullable=False)
-    status: str = Column(String, default="draft")  # draft|active|paused|ended
-    target: Any = Column(JSON, default=dict)  # {type: all|segment|users, ids:[...]}
-    start_at: Optional[datetime] = Column(DateTime, nullable=True)
-    end_at: Optional[datetime] = Column(DateTime, nullable=True)
-    deeplink_url: Optional[str] = Column(String, nullable=True)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    name: Mapped[str]
+    status: Mapped[CampaignStatus] = mapped_column(
+        IntEnumType(CampaignStatus), default=CampaignStatus.DRAFT
+    )
+    # {type: all|segment|users, ids:[...]}
+    target: Mapped[Optional[Any]] = mapped_column(JSONType, default=dict)
+    start_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    end_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    deeplink_url: Mapped[Optional[str]]
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    tenant = relationship("Tenant", back_populates="campaigns")
-    offers = relationship("Offer", back_populates="campaign")
-    push_notifications = relationship("PushNotification", back_populates="campaign")
+    __table_args__ = (
+        Index("ix_campaigns_tenant_status", "tenant_id", "status"),
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="campaigns")
+    offers: Mapped[List[Offer]] = relationship(back_populates="campaign", lazy="selectin")
+    push_notifications: Mapped[List[PushNotification]] = relationship(
+        back_populates="campaign", lazy="selectin"
+    )
 
 
 class Offer(Base):
     __tablename__ = "offers"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    campaign_id: Optional[str] = Column(String, ForeignKey("campaigns.id"), nullable=True)
-    type: str = Column(String, nullable=False)  # personal|group
-    benefit: Any = Column(JSON, nullable=False)  # {kind:%|fixed, value:int}
-    limits: Any = Column(JSON, default=dict)  # {per_user:int, total:int, min_spend_cents:int}
-    applies_to: Any = Column(JSON, default=list)  # list of SKUs
-    valid_from: datetime = Column(DateTime, nullable=False)
-    valid_to: datetime = Column(DateTime, nullable=False)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    tenant = relationship("Tenant", back_populates="offers")
-    campaign = relationship("Campaign", back_populates="offers")
-    vouchers = relationship("Voucher", back_populates="offer")
-    redemptions = relationship("Redemption", back_populates="offer")
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    campaign_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("campaigns.id"))
+    type: Mapped[OfferType] = mapped_column(IntEnumType(OfferType))
+    benefit: Mapped[Any] = mapped_column(JSONType)  # {kind:%|fixed, value:int}
+    # {per_user:int, total:int, min_spend_cents:int}
+    limits: Mapped[Optional[Any]] = mapped_column(JSONType, default=dict)
+    applies_to: Mapped[Optional[Any]] = mapped_column(JSONType, default=list)  # list of SKUs
+    valid_from: Mapped[datetime] = mapped_column(DateTime)
+    valid_to: Mapped[datetime] = mapped_column(DateTime)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_offers_tenant_valid", "tenant_id", "valid_to"),
+        Index("ix_offers_applies_to_gin", "applies_to", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="offers")
+    campaign: Mapped[Optional[Campaign]] = relationship(back_populates="offers")
+    vouchers: Mapped[List[Voucher]] = relationship(back_populates="offer", lazy="raise_on_sql")
+    redemptions: Mapped[List[Redemption]] = relationship(
+        back_populates="offer", lazy="raise_on_sql"
+    )
 
 
 class Voucher(Base):
     __tablename__ = "vouchers"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    offer_id: str = Column(String, ForeignKey("offers.id"), nullable=False)
-    user_id: str = Column(String, ForeignKey("users.id"), nullable=False)
-    code: str = Column(String, unique=True, nullable=False)
-    state: str = Column(String, default="issued")  # issued|redeemed|expired|void
-    redemption_id: Optional[str] = Column(String, ForeignKey("redemptions.id"), nullable=True)
-    issued_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    offer_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("offers.id"))
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"))
+    code: Mapped[str] = mapped_column(String(VOUCHER_CODE_LENGTH), default=generate_voucher_code)
+    state: Mapped[VoucherState] = mapped_column(
+        IntEnumType(VoucherState), default=VoucherState.ISSUED
+    )
+    issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    tenant = relationship("Tenant", back_populates="vouchers")
-    offer = relationship("Offer", back_populates="vouchers")
-    user = relationship("User", back_populates="vouchers")
-    redemption = relationship("Redemption", back_populates="voucher")
+    __table_args__ = (
+        # Codes only need to be unique within a tenant; this also serves the
+        # (tenant_id, code) lookup at the POS.
+        UniqueConstraint("tenant_id", "code", name="uix_tenant_voucher_code"),
+        Index(
+            "ix_vouchers_tenant_state", "tenant_id", "state", postgresql_include=("id",)
+        ),
+        # Partial index over unredeemed vouchers only; redeemed/expired rows
+        # dominate over time and would otherwise bloat the wallet lookup.
+        Index(
+            "ix_voucher_active",
+            "tenant_id",
+            "user_id",
+            "offer_id",
+            sqlite_where=state == VoucherState.ISSUED,
+            postgresql_where=state == VoucherState.ISSUED,
+        ),
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="vouchers")
+    offer: Mapped[Offer] = relationship(back_populates="vouchers", lazy="joined")
+    user: Mapped[User] = relationship(back_populates="vouchers", lazy="joined")
+    redemption: Mapped[Optional[Redemption]] = relationship(back_populates="voucher")
 
 
 class PushNotification(Base):
     __tablename__ = "push_notifications"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    campaign_id: Optional[str] = Column(String, ForeignKey("campaigns.id"), nullable=True)
-    payload: Any = Column(JSON, nullable=False)  # {title, body, deeplink}
-    scheduled_at: Optional[datetime] = Column(DateTime, nullable=True)
-    sent_at: Optional[datetime] = Column(DateTime, nullable=True)
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    campaign_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("campaigns.id"))
+    payload: Mapped[Any] = mapped_column(JSONType)  # {title, body, deeplink}
+    scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_pushnotif_tenant_scheduled", "tenant_id", "scheduled_at"),
+    )
 
-    tenant = relationship("Tenant")
-    campaign = relationship("Campaign", back_populates="push_notifications")
+    tenant: Mapped[Tenant] = relationship()
+    campaign: Mapped[Optional[Campaign]] = relationship(back_populates="push_notifications")
 
 
 class Redemption(Base):
     __tablename__ = "redemptions"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    offer_id: str = Column(String, ForeignKey("offers.id"), nullable=False)
-    user_id: Optional[str] = Column(String, ForeignKey("users.id"), nullable=True)
-    voucher_id: Optional[str] = Column(String, ForeignKey("vouchers.id"), nullable=True)
-    pos_ref: Optional[str] = Column(String, nullable=True)
-    status: str = Column(String, nullable=False)  # approved|denied|settled
-    reason: Optional[str] = Column(String, nullable=True)
-    redeemed_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
-
-    tenant = relationship("Tenant", back_populates="redemptions")
-    offer = relationship("Offer", back_populates="redemptions")
-    user = relationship("User", back_populates="redemptions")
-    voucher = relationship("Voucher", back_populates="redemption")
-    transaction = relationship("Transaction", back_populates="redemption", uselist=False)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"))
+    offer_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("offers.id"))
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("users.id"))
+    voucher_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("vouchers.id"))
+    pos_ref: Mapped[Optional[str]]
+    status: Mapped[RedemptionStatus] = mapped_column(IntEnumType(RedemptionStatus))
+    reason: Mapped[Optional[str]]
+    redeemed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_redemptions_tenant_redeemed", "tenant_id", "redeemed_at"),
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="redemptions")
+    offer: Mapped[Offer] = relationship(back_populates="redemptions")
+    user: Mapped[Optional[User]] = relationship(back_populates="redemptions")
+    voucher: Mapped[Optional[Voucher]] = relationship(back_populates="redemption", lazy="joined")
+    transaction: Mapped[Optional[Transaction]] = relationship(back_populates="redemption")
 
 
 class Transaction(Base):
     __tablename__ = "transactions"
-    id: str = Column(String, primary_key=True, default=generate_uuid)
-    tenant_id: str = Column(String, ForeignKey("tenants.id"), nullable=False)
-    user_id: Optional[str] = Column(String, ForeignKey("users.id"), nullable=True)
-    pos_txn_id: str = Column(String, nullable=False)
-    store_id: Optional[str] = Column(String, nullable=True)
-    purchased_at: datetime = Column(DateTime, nullable=False)
-    total_cents: int = Column(Integer, nullable=False)
-    currency: str = Column(String, default="USD", nullable=False)
-    lines: Any = Column(JSON, nullable=False)  # list of {sku, qty, unit_price_cents}
-    attribution: Any = Column(JSON, default=dict)  # {campaign_id, offer_id, redemption_id}
-    created_at: datetime = Column(DateTime, default=datetime.utcnow, nullable=False)
-    redemption_id: Optional[str] = Column(String, ForeignKey("redemptions.id"), nullable=True)
-
-    tenant = relationship("Tenant", back_populates="transactions")
-    user = relationship("User", back_populates="transactions")
-    redemption = relationship("Redemption", back_populates="transaction")
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    # Part of the primary key because PostgreSQL requires the partition key in
+    # every unique constraint of a partitioned table.
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), primary_key=True)
+    user_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("users.id"))
+    pos_txn_id: Mapped[str]
+    store_id: Mapped[Optional[str]]
+    purchased_at: Mapped[datetime] = mapped_column(DateTime)
+    total_cents: Mapped[int]
+    currency: Mapped[str] = mapped_column(CHAR(3), server_default="USD")
+    # extra attribution metadata
+    attribution: Mapped[Optional[Any]] = mapped_column(JSONType, default=dict)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    redemption_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("redemptions.id"))
+    campaign_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("campaigns.id"), index=True)
+    offer_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey("offers.id"), index=True)
+
+    __table_args__ = (
+        # Makes POS ingestion idempotent per tenant.
+        UniqueConstraint("tenant_id", "pos_txn_id", name="uix_txn_tenant_pos"),
+        CheckConstraint(
+            "currency IN (%s)" % ", ".join(f"'{code}'" for code in SUPPORTED_CURRENCIES),
+            name="ck_txn_currency",
+        ),
+        Index(
+            "ix_transactions_tenant_purchased",
+            "tenant_id",
+            "purchased_at",
+            postgresql_include=("id",),
+        ),
+        Index("ix_txn_tenant_campaign_purchased", "tenant_id", "campaign_id", "purchased_at"),
+        Index("ix_transactions_attribution_gin", "attribution", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        {"postgresql_partition_by": "HASH (tenant_id)"},
+    )
+
+    tenant: Mapped[Tenant] = relationship(back_populates="transactions")
+    user: Mapped[Optional[User]] = relationship(back_populates="transactions")
+    redemption: Mapped[Optional[Redemption]] = relationship(
+        back_populates="transaction", lazy="joined"
+    )
+    lines: Mapped[List[TransactionLine]] = relationship(
+        back_populates="transaction", cascade="all, delete-orphan", lazy="selectin"
+    )
+
+
+class TransactionLine(Base):
+    __tablename__ = "transaction_lines"
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), primary_key=True)
+    transaction_id: Mapped[uuid.UUID]
+    sku: Mapped[str]
+    qty: Mapped[int]
+    unit_price_cents: Mapped[int]
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["transaction_id", "tenant_id"], ["transactions.id", "transactions.tenant_id"]
+        ),
+        Index("ix_txnline_transaction", "tenant_id", "transaction_id"),
+        Index("ix_txnline_sku", "tenant_id", "sku"),
+        {"postgresql_partition_by": "HASH (tenant_id)"},
+    )
+
+    transaction: Mapped[Transaction] = relationship(back_populates="lines")
+
+
+TENANT_PARTITIONS = 16
+
+
+def _create_hash_partitions(table, modulus: int = TENANT_PARTITIONS) -> None:
+    """Create `modulus` hash partitions of `table` after it is created on PostgreSQL.
+
+    Tenant-scoped queries are then pruned to a single partition.
+    """
+    for remainder in range(modulus):
+        event.listen(
+            table,
+            "after_create",
+            DDL(
+                f"CREATE TABLE {table.name}_p{remainder} PARTITION OF {table.name} "
+                f"FOR VALUES WITH (MODULUS {modulus}, REMAINDER {remainder})"
+            ).execute_if(dialect="postgresql"),
+        )
+
+
+_create_hash_partitions(Transaction.__table__)
+_create_hash_partitions(TransactionLine.__table__)
@@ -0,0 +1,96 @@
+"""Hot-path ORM queries for the loyalty prototype.
+
+Every query lists the relationships it needs explicitly and ends with
+`raiseload("*")`, which overrides the mapper-level loader defaults for
+everything else.  Touching an attribute that was not loaded raises instead of
+silently emitting a per-row SELECT, so N+1 regressions surface as soon as a
+caller starts using a new relationship.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+
+from models import Campaign, Redemption, Transaction, User, Voucher, VoucherState
+
+
+def get_user_by_email(session: Session, tenant_id: uuid.UUID, email: str) -> Optional[User]:
+    """Case-insensitive user lookup; served by the (tenant_id, lower(email)) index.
+
+    Both sides are folded by the database's lower(), the expression the unique
+    index is built on (ASCII-only on SQLite).
+    """
+    stmt = (
+        select(User)
+        .where(User.tenant_id == tenant_id, func.lower(User.email) == func.lower(email))
+        .options(raiseload("*"))
+    )
+    return session.scalars(stmt).one_or_none()
+
+
+def get_redeemable_voucher(
+    session: Session, tenant_id: uuid.UUID, code: str
+) -> Optional[Voucher]:
+    """Look up an issued voucher by code at the POS, with its offer and user."""
+    stmt = (
+        select(Voucher)
+        .where(
+            Voucher.tenant_id == tenant_id,
+            Voucher.code == code,
+            Voucher.state == VoucherState.ISSUED,
+        )
+        .options(joinedload(Voucher.offer), joinedload(Voucher.user), raiseload("*"))
+    )
+    return session.scalars(stmt).one_or_none()
+
+
+def list_active_vouchers(
+    session: Session, tenant_id: uuid.UUID, user_id: uuid.UUID
+) -> List[Voucher]:
+    """Return a user's issued (unredeemed) vouchers with their offers."""
+    stmt = (
+        select(Voucher)
+        .where(
+            Voucher.tenant_id == tenant_id,
+            Voucher.user_id == user_id,
+            Voucher.state == VoucherState.ISSUED,
+        )
+        .options(joinedload(Voucher.offer), raiseload("*"))
+    )
+    return list(session.scalars(stmt))
+
+
+def get_transaction(
+    session: Session, tenant_id: uuid.UUID, transaction_id: uuid.UUID
+) -> Optional[Transaction]:
+    """Load a transaction with its lines and the redemption/voucher it used."""
+    stmt = (
+        select(Transaction)
+        .where(Transaction.tenant_id == tenant_id, Transaction.id == transaction_id)
+        .options(
+            selectinload(Transaction.lines),
+            joinedload(Transaction.redemption).joinedload(Redemption.voucher),
+            raiseload("*"),
+        )
+    )
+    return session.scalars(stmt).one_or_none()
+
+
+def get_campaign(
+    session: Session, tenant_id: uuid.UUID, campaign_id: uuid.UUID
+) -> Optional[Campaign]:
+    """Load a campaign with its offers and push notifications."""
+    stmt = (
+        select(Campaign)
+        .where(Campaign.tenant_id == tenant_id, Campaign.id == campaign_id)
+        .options(
+            selectinload(Campaign.offers),
+            selectinload(Campaign.push_notifications),
+            raiseload("*"),
+        )
+    )
+    return session.scalars(stmt).one_or_none()
@@ -0,0 +1,99 @@
+"""Shared fixtures: an in-memory SQLite schema, seed data and a query counter."""
+
+from __future__ import annotations
+
+import os
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import models  # noqa: E402
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    models.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def seeded(engine):
+    """One tenant with a campaign, offer, voucher, redemption and transaction."""
+    when = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        tenant = models.Tenant(name="acme")
+        user = models.User(tenant=tenant, email="shopper@example.com")
+        campaign = models.Campaign(tenant=tenant, name="spring")
+        offer = models.Offer(
+            tenant=tenant,
+            campaign=campaign,
+            type=models.OfferType.PERSONAL,
+            benefit={"kind": "%", "value": 10},
+            valid_from=when,
+            valid_to=when,
+        )
+        voucher = models.Voucher(
+            tenant=tenant, offer=offer, user=user, state=models.VoucherState.REDEEMED
+        )
+        redemption = models.Redemption(
+            tenant=tenant,
+            offer=offer,
+            user=user,
+            voucher=voucher,
+            status=models.RedemptionStatus.APPROVED,
+        )
+        transaction = models.Transaction(
+            tenant=tenant,
+            user=user,
+            pos_txn_id="pos-1",
+            purchased_at=when,
+            total_cents=1000,
+            redemption=redemption,
+            lines=[models.TransactionLine(sku="SKU1", qty=1, unit_price_cents=1000)],
+        )
+        issued = models.Voucher(tenant=tenant, offer=offer, user=user)
+        session.add_all([transaction, issued])
+        session.commit()
+        return SimpleNamespace(
+            tenant_id=tenant.id,
+            user_id=user.id,
+            campaign_id=campaign.id,
+            offer_id=offer.id,
+            transaction_id=transaction.id,
+            issued_code=issued.code,
+        )
+
+
+@pytest.fixture
+def session(engine, seeded):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def count_queries(engine):
+    """Context manager collecting every statement sent to the database."""
+
+    @contextmanager
+    def counter():
+        queries = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield queries
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+
+import bulk
+import models
+
+
+def test_uuid7_batch_is_sorted_and_unique():
+    ids = models.uuid7_batch(500)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 500
+    assert {key.version for key in ids} == {7}
+
+
+def test_bulk_issue_vouchers(session, seeded, count_queries):
+    users = [models.User(tenant_id=seeded.tenant_id) for _ in range(50)]
+    session.add_all(users)
+    session.flush()
+    user_ids = [user.id for user in users]
+
+    with count_queries() as executed:
+        ids = bulk.bulk_issue_vouchers(session, seeded.tenant_id, seeded.offer_id, user_ids)
+    assert len(executed) == 1
+    session.commit()
+
+    assert ids == sorted(ids)
+    stored = session.scalars(
+        select(models.Voucher).where(models.Voucher.id.in_(ids)).order_by(models.Voucher.id)
+    ).all()
+    assert [voucher.id for voucher in stored] == ids
+    assert [voucher.user_id for voucher in stored] == user_ids
+    for voucher in stored:
+        assert voucher.tenant_id == seeded.tenant_id
+        assert voucher.offer_id == seeded.offer_id
+        assert voucher.state == models.VoucherState.ISSUED
+        assert len(voucher.code) == models.VOUCHER_CODE_LENGTH
+        assert voucher.issued_at is not None
+
+
+def test_bulk_issue_vouchers_with_no_users(session, seeded, count_queries):
+    with count_queries() as executed:
+        assert bulk.bulk_issue_vouchers(session, seeded.tenant_id, seeded.offer_id, []) == []
+    assert executed == []
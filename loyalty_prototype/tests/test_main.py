@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import math
+
+import orjson
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+import main
+import models
+
+
+def test_dumps_uses_orjson_for_plain_documents():
+    value = {"kind": "%", "value": 10, "skus": ["A", "B"], "note": None}
+    assert main._orjson_dumps(value) == orjson.dumps(value).decode()
+
+
+def test_dumps_converts_non_string_keys_like_json():
+    value = {1: ["a"], None: True, 2.5: "x"}
+    assert json.loads(main._orjson_dumps(value)) == json.loads(json.dumps(value))
+
+
+@pytest.mark.parametrize("number", [2**64 + 1, -(2**64) - 1, 2**70 + 3])
+def test_wide_integers_round_trip(number):
+    encoded = main._orjson_dumps({"n": number})
+    assert encoded == json.dumps({"n": number})
+    decoded = main._orjson_loads(encoded)
+    assert decoded == {"n": number} and isinstance(decoded["n"], int)
+
+
+@pytest.mark.parametrize("number", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_floats_round_trip(number):
+    encoded = main._orjson_dumps({"f": [number], "g": None})
+    assert encoded == json.dumps({"f": [number], "g": None})
+
+    decoded = main._orjson_loads(encoded)
+    assert decoded["g"] is None
+    if math.isnan(number):
+        assert math.isnan(decoded["f"][0])
+    else:
+        assert decoded["f"][0] == number
+
+
+def test_loads_keeps_long_digit_runs_inside_strings():
+    text = '{"code": "1234567890123456789012", "n": 5}'
+    assert main._orjson_loads(text) == {"code": "1234567890123456789012", "n": 5}
+
+
+def test_loads_uses_orjson_for_plain_documents():
+    assert main._orjson_loads('{"a": [1, 2.5, null, true]}') == {"a": [1, 2.5, None, True]}
+
+
+def test_engine_codec_round_trips_json_columns():
+    engine = create_engine("sqlite://", **main.engine_options("sqlite://"))
+    models.Base.metadata.create_all(engine)
+    target = {1: ["x"], "big": 2**70 + 3, "ratio": float("inf")}
+    with Session(engine) as session:
+        tenant = models.Tenant(name="acme")
+        session.add(models.Campaign(tenant=tenant, name="spring", target=target))
+        session.commit()
+        session.expire_all()
+        stored = session.scalars(select(models.Campaign.target)).one()
+    assert stored == json.loads(json.dumps(target))
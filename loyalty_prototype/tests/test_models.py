@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import warnings
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SAWarning
+
+import models
+
+
+def test_json_contains_compiles_to_jsonb_containment():
+    stmt = select(models.Offer.id).where(models.Offer.applies_to.contains(["SKU123"]))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "offers.applies_to @> " in sql
+    assert "LIKE" not in sql
+
+
+def test_get_voucher_is_a_single_select(session, seeded, count_queries):
+    voucher_id = session.scalars(
+        select(models.Voucher.id).where(models.Voucher.code == seeded.issued_code)
+    ).one()
+    session.expunge_all()
+
+    with count_queries() as executed:
+        voucher = session.get(models.Voucher, voucher_id)
+        assert voucher.offer.id == seeded.offer_id and voucher.user.id == seeded.user_id
+    assert len(executed) == 1
+
+
+def test_schema_has_no_foreign_key_cycle():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        models.Base.metadata.sorted_tables
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+
+import models
+import queries
+
+
+@pytest.mark.parametrize(
+    "stored, lookup",
+    [
+        ("Élodie@x.com", "Élodie@x.com"),
+        # SQLite's lower() folds ASCII only; both sides go through it, so
+        # non-ASCII letters must match as stored while ASCII case may vary.
+        ("Élodie@x.com", "ÉLODIE@X.COM"),
+        ("Buyer@Example.com", "buyer@EXAMPLE.COM"),
+    ],
+)
+def test_get_user_by_email_is_case_insensitive(session, seeded, stored, lookup):
+    session.add(models.User(tenant_id=seeded.tenant_id, email=stored))
+    session.flush()
+
+    user = queries.get_user_by_email(session, seeded.tenant_id, lookup)
+    assert user is not None and user.email == stored
+
+
+def test_get_user_by_email_uses_lower_email_index(engine, session, seeded):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        queries.get_user_by_email(session, seeded.tenant_id, "shopper@example.com")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    (statement, parameters), = executed
+    plan = session.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+    assert any("uix_user_tenant_email_lower" in row[-1] for row in plan)
+
+
+def test_duplicate_email_differing_in_case_is_rejected(session, seeded):
+    session.add(models.User(tenant_id=seeded.tenant_id, email="SHOPPER@example.com"))
+    with pytest.raises(IntegrityError):
+        session.flush()
+
+
+def test_get_redeemable_voucher(session, seeded, count_queries):
+    with count_queries() as executed:
+        voucher = queries.get_redeemable_voucher(session, seeded.tenant_id, seeded.issued_code)
+        assert voucher.offer.campaign_id == seeded.campaign_id
+        assert voucher.user.email == "shopper@example.com"
+    assert len(executed) <= 1
+
+    with pytest.raises(InvalidRequestError):
+        voucher.redemption
+
+
+def test_list_active_vouchers(session, seeded, count_queries):
+    with count_queries() as executed:
+        vouchers = queries.list_active_vouchers(session, seeded.tenant_id, seeded.user_id)
+        assert [v.code for v in vouchers] == [seeded.issued_code]
+        assert vouchers[0].offer.benefit == {"kind": "%", "value": 10}
+    assert len(executed) <= 1
+
+    with pytest.raises(InvalidRequestError):
+        vouchers[0].user
+
+
+def test_get_transaction(session, seeded, count_queries):
+    with count_queries() as executed:
+        transaction = queries.get_transaction(session, seeded.tenant_id, seeded.transaction_id)
+        assert [line.sku for line in transaction.lines] == ["SKU1"]
+        assert transaction.redemption.voucher.state == queries.VoucherState.REDEEMED
+    assert len(executed) <= 2
+
+    with pytest.raises(InvalidRequestError):
+        transaction.user
+
+
+def test_get_campaign(session, seeded, count_queries):
+    with count_queries() as executed:
+        campaign = queries.get_campaign(session, seeded.tenant_id, seeded.campaign_id)
+        assert len(campaign.offers) == 1
+        assert campaign.push_notifications == []
+    assert len(executed) <= 3
+
+    with pytest.raises(InvalidRequestError):
+        campaign.tenant